@@ -1,68 +1,164 @@
+import bisect
 import io
+import os
 import re
-from typing import Optional, Dict, List
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Optional, Dict, List, NamedTuple, Union
 from decimal import Decimal, InvalidOperation
-from pdfminer.high_level import extract_text
-from pdfminer.layout import LAParams
 
-# Accept amounts like "146,306", "146 306", "307 , 394", with optional $ and parentheses.
+# A PDF may arrive as raw bytes, a filesystem path (mmap-friendly), or an
+# open binary file object (e.g. Django's UploadedFile).
+PdfSource = Union[bytes, str, Path, IO[bytes]]
+
+# Prefer PyMuPDF (C-backed, ~3-5x faster on big 10-Ks); fall back to
+# pdfminer.six for deployments that can't take PyMuPDF's AGPL license.
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # older PyMuPDF releases only expose the 'fitz' name
+    except ImportError:
+        fitz = None
+        from pdfminer.high_level import extract_text
+
+# Accept amounts like "146,306", "146 306", "$307,394", with optional
+# parentheses. Exactly one separator char between digit groups — the old
+# pattern's `\s*` on both sides of the separator made matches ambiguous and
+# let long digit-heavy table lines backtrack quadratically. The separator is
+# comma/period or intra-line whitespace ([^\S\n]); newlines are excluded so
+# that scanning a multi-line window never merges tokens across lines.
 _NUMBER_RE = re.compile(
-    r'\(?\s*\$?\s*\d{1,3}(?:\s*[,\.\s]\s*\d{3})*(?:\.\d+)?\s*\)?'
+    r'\(?\$?\d{1,3}(?:(?:[,.]|[^\S\n])\d{3})*(?:\.\d+)?\)?'
 )
 
-# Labels (initial scope; variants deferred to live session except COS broadened)
-_REVENUE_LABEL_RE = re.compile(r'\bRevenues?\b', re.IGNORECASE)
-_COS_LABEL_RE     = re.compile(r'\bCost\s+of\s+(Sales|Revenue|Revenues)\b', re.IGNORECASE)
+# Labels (initial scope; variants deferred to live session except COS
+# broadened). A single alternation so one finditer pass over the text finds
+# both; `m.lastgroup` tells which label was hit.
+_LABELS_RE = re.compile(
+    r'(?P<rev>\bRevenues?\b)|(?P<cos>\bCost\s+of\s+(?:Sales|Revenue|Revenues)\b)',
+    re.IGNORECASE,
+)
+
+# Discovery needles: lowercase prefixes of every alternative in _LABELS_RE.
+# The regex verifies word boundaries and the full variant at each hit, so
+# these only have to be cheap to locate, not exact.
+_LABEL_NEEDLES = ('revenue', 'cost')
+
+# Optional: pyahocorasick matches all needles in one C-level DFA pass, which
+# scales to dozens of labels (Gross Profit, Operating Income, ...) for free.
+# Without it, a str.find merge over the needles does the same job for two.
+try:
+    import ahocorasick
+except ImportError:
+    _LABEL_AUTOMATON = None
+else:
+    _LABEL_AUTOMATON = ahocorasick.Automaton()
+    for _word in _LABEL_NEEDLES:
+        _LABEL_AUTOMATON.add_word(_word, len(_word))
+    _LABEL_AUTOMATON.make_automaton()
+
+
+# Translate tables strip $/grouping chars (and parens, for digit tests) in a
+# single C pass instead of a chain of str.replace copies per token. Tab, NBSP
+# and CR are included because PDF text uses them as intra-line whitespace and
+# _NUMBER_RE admits them as group separators.
+_NORM_TBL = str.maketrans('', '', '$, .\t\xa0\r')
+_DIGITS_TBL = str.maketrans('', '', '$, .()\t\xa0\r')
+
+
+def _digits_only(raw: str) -> str:
+    """Token reduced to its bare digits (drops $, grouping chars, parens)."""
+    return raw.translate(_DIGITS_TBL)
 
 
 def _normalize_value(value: str) -> str:
     """Remove $, commas, spaces, periods; convert '(123)' -> '-123'."""
-    v = value.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '')
+    v = value.translate(_NORM_TBL)
     if v.startswith('(') and v.endswith(')'):
         v = '-' + v[1:-1]
     return v
 
 
-def _looks_like_year(token: str) -> bool:
-    """Treat a bare 4-digit 1900–2100 token as a year (avoid grabbing headers)."""
-    t = token.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '')
-    return len(t) == 4 and t.isdigit() and 1900 <= int(t) <= 2100
+class Tok(NamedTuple):
+    """A numeric token with its features and score, computed once per distinct string."""
+    raw: str
+    norm: str
+    has_dollar: bool
+    has_group: bool
+    is_year: bool
+    score: int
 
 
-def _money_like_tokens(tokens: List[str]) -> List[str]:
+def _score_from_mask(mask: int) -> int:
     """
-    Keep tokens that look like money: has $, has grouping chars, or ≥4 digits
-    after normalization. If nothing qualifies, fall back to originals.
+    Score for one feature combination (higher = more likely a money amount).
+    Bits: dollar<<5 | group<<4 | len>=6<<3 | len>=4<<2 | paren<<1 | year.
+    Only evaluated 64 times at import to fill _SCORE_LUT; runtime scoring is
+    a single table load instead of six branches.
     """
-    good: List[str] = []
-    for raw in tokens:
-        norm = raw.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '')
-        has_group = (',' in raw) or (' ' in raw) or ('.' in raw)
-        if ('$' in raw) or has_group or (norm.isdigit() and len(norm) >= 4):
-            good.append(raw)
-    return good or tokens
-
-
-def _score_token(raw: str) -> int:
-    """Higher score = more likely a money amount."""
-    has_dollar = '$' in raw
-    has_paren  = '(' in raw and ')' in raw
-    has_group  = (',' in raw) or (' ' in raw) or ('.' in raw)
-    norm = raw.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '')
-    is_year = _looks_like_year(raw)
+    has_dollar = bool(mask & 32)
+    has_group  = bool(mask & 16)
+    len_ge_6   = bool(mask & 8)
+    len_ge_4   = bool(mask & 4)
+    has_paren  = bool(mask & 2)
+    is_year    = bool(mask & 1)
 
     score = 0
     if has_dollar: score += 4
     if has_group:  score += 3
-    if len(norm) >= 6: score += 3
-    elif len(norm) >= 4: score += 2
+    if len_ge_6: score += 3
+    elif len_ge_4: score += 2
     else: score -= 2  # penalize tiny tokens like "202" or "(1)"
     if has_paren: score += 1
     if is_year and not has_dollar: score -= 5
     return score
 
 
-def _pick_best(candidates: List[str]) -> Optional[str]:
+_SCORE_LUT = array('i', [_score_from_mask(m) for m in range(64)])
+
+
+@lru_cache(maxsize=4096)
+def _tok(raw: str) -> Tok:
+    """
+    Build (and memoize) the feature tuple for a raw token. 10-K tables repeat
+    the same token shapes many times, so the cache skips re-normalizing them.
+    A bare 4-digit 1900–2100 value counts as a year (avoid grabbing headers).
+    The score is precomputed here so the pick loop does no per-candidate work.
+    """
+    norm = _digits_only(raw)
+    n = len(norm)
+    has_dollar = '$' in raw
+    has_group = (',' in raw) or (' ' in raw) or ('.' in raw)
+    has_paren = '(' in raw and ')' in raw
+    is_year = n == 4 and norm.isdigit() and 1900 <= int(norm) <= 2100
+    mask = ((has_dollar << 5) | (has_group << 4) | ((n >= 6) << 3)
+            | ((n >= 4) << 2) | (has_paren << 1) | is_year)
+    return Tok(
+        raw=raw,
+        norm=norm,
+        has_dollar=has_dollar,
+        has_group=has_group,
+        is_year=is_year,
+        score=_SCORE_LUT[mask],
+    )
+
+
+def _money_like_tokens(tokens: List[Tok]) -> List[Tok]:
+    """
+    Keep tokens that look like money: has $, has grouping chars, or ≥4 digits
+    after normalization. If nothing qualifies, fall back to originals.
+    """
+    good = [
+        t for t in tokens
+        if t.has_dollar or t.has_group or (t.norm.isdigit() and len(t.norm) >= 4)
+    ]
+    return good or tokens
+
+
+def _pick_best(candidates: List[Tok]) -> Optional[Tok]:
     """Score candidates; on tie, prefer the later token on the line (current period bias)."""
     if not candidates:
         return None
@@ -70,131 +166,372 @@ def _pick_best(candidates: List[str]) -> Optional[str]:
     best_idx = -1
     best_score = -10**9
     for idx, c in enumerate(candidates):
-        s = _score_token(c)
-        if s > best_score or (s == best_score and idx > best_idx):
-            best_score, best_idx = s, idx
+        if c.score > best_score or (c.score == best_score and idx > best_idx):
+            best_score, best_idx = c.score, idx
     return candidates[best_idx]
 
 
-def _best_number_after_label(line: str, label_match: re.Match) -> Optional[str]:
+def _line_starts(text: str) -> array:
     """
-    Choose the best numeric token AFTER the label on the same line.
-    Only consider tokens that look like money (has $ OR >=4 digits after normalize)
-    and are not bare years. If none qualify, return None so we fall back to look-ahead.
+    Start offset of every line in `text`, with a final sentinel of
+    len(text)+1 so line i always spans [starts[i], starts[i+1]-1). Lines are
+    then materialized (sliced) only when the scan actually needs one,
+    instead of allocating a stripped copy of every line up front.
     """
-    start_idx = label_match.end()
-    raw = [m.group(0) for m in _NUMBER_RE.finditer(line, pos=start_idx)]
-    if not raw:
+    starts = array('i', [0])
+    find = text.find
+    pos = find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find('\n', pos + 1)
+    starts.append(len(text) + 1)
+    return starts
+
+
+def _label_hits(low: str):
+    """Yield candidate label start offsets in text order (lowercased input)."""
+    if _LABEL_AUTOMATON is not None:
+        # Needles don't overlap each other, so end order == start order.
+        for end, length in _LABEL_AUTOMATON.iter(low):
+            yield end - length + 1
+    else:
+        rev_at = low.find('revenue')
+        cos_at = low.find('cost')
+        while rev_at != -1 or cos_at != -1:
+            if cos_at == -1 or (rev_at != -1 and rev_at < cos_at):
+                yield rev_at
+                rev_at = low.find('revenue', rev_at + 1)
+            else:
+                yield cos_at
+                cos_at = low.find('cost', cos_at + 1)
+
+
+def _label_matches(scan_text: str):
+    """
+    Yield label matches in text order. Candidate offsets come from a single
+    C-level pass (Aho–Corasick DFA, or a str.find merge without the optional
+    dependency), and the label regex only runs at those offsets to verify
+    word boundaries and pick the variant — an O(hits) regex workload instead
+    of O(text).
+    """
+    low = scan_text.lower()
+    pos = 0
+    for hit in _label_hits(low):
+        # Skip hits inside an already-consumed match so "Revenue" within a
+        # matched "Cost of Revenue" is not reported again (finditer semantics).
+        if hit < pos:
+            continue
+        m = _LABELS_RE.match(scan_text, hit)
+        if m:
+            yield m
+            pos = m.end()
+
+
+def _best_number_after_label(line: str, start_idx: int) -> Optional[str]:
+    """
+    Choose the best numeric token AFTER the label (ending at `start_idx`) on
+    the same line. Only consider tokens that look like money (has $ OR >=4
+    digits after normalize) and are not bare years. If none qualify, return
+    None so we fall back to look-ahead.
+    """
+    # Cheap C-level prefilter: don't invoke the regex engine on digit-free text.
+    if not any(c.isdigit() for c in line[start_idx:]):
+        return None
+    toks = [_tok(m.group(0)) for m in _NUMBER_RE.finditer(line, pos=start_idx)]
+    if not toks:
         return None
 
     # Keep tokens that look like money
-    candidates: List[str] = []
-    for t in raw:
-        norm = t.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '').replace('(', '').replace(')', '')
-        money_like = ('$' in t) or (norm.isdigit() and len(norm) >= 4)
-        if money_like and not _looks_like_year(t):
-            candidates.append(t)
+    candidates = [
+        t for t in toks
+        if (t.has_dollar or (t.norm.isdigit() and len(t.norm) >= 4)) and not t.is_year
+    ]
 
     if not candidates:
         return None  # force look-ahead to find the actual amount line
 
-    return _pick_best(candidates)
+    best = _pick_best(candidates)
+    return best.raw if best else None
 
 def _pick_leftmost(candidates: List[str]) -> Optional[str]:
     """Pick the leftmost candidate (index 0) after prior filtering."""
     return candidates[0] if candidates else None
 
 
-def _best_number_in_next_lines(lines: List[str], start_idx: int, window: int = 10) -> Optional[str]:
+def _best_line_token(toks: List[Tok]) -> Optional[str]:
     """
-    Look forward up to `window` lines for the first money-like token.
-    Priority per line:
+    Resolve one look-ahead line's tokens:
       1) If any tokens contain '$', consider ONLY those and pick the LEFTMOST.
       2) Else consider tokens with >= 4 digits after normalization (and not a year) and pick the LEFTMOST.
-      3) Else continue to next line.
-    Returns the RAW token string (caller will normalize).
+      3) Else None (caller moves on to the next line).
     """
-    for j in range(1, window + 1):
-        i = start_idx + j
-        if i >= len(lines):
-            break
-        line = lines[i].strip()
-        if not line:
-            continue
+    dollar_tokens = [t.raw for t in toks if t.has_dollar]
+    if dollar_tokens:
+        return _pick_leftmost(dollar_tokens)
 
-        raw_tokens = [m.group(0) for m in _NUMBER_RE.finditer(line)]
-        if not raw_tokens:
-            continue
+    long_tokens = [
+        t.raw for t in toks
+        if t.norm.isdigit() and len(t.norm) >= 4 and not t.is_year
+    ]
+    return _pick_leftmost(long_tokens)
+
+
+def _best_number_in_next_lines(text: str, starts: array, start_idx: int,
+                               window: int = 10) -> Optional[str]:
+    """
+    Look forward up to `window` lines for the first money-like token, with
+    per-line priority as in _best_line_token. Returns the RAW token string
+    (caller will normalize). The whole window is one contiguous slice of
+    `text`, so a single finditer pass tokenizes it; tokens are grouped back
+    into lines by their offsets and each line resolved in order.
+    """
+    n_lines = len(starts) - 1
+    first = start_idx + 1
+    if first >= n_lines:
+        return None
+    last = min(start_idx + window, n_lines - 1)
+    lo = starts[first]
+    window_text = text[lo:starts[last + 1] - 1]
+
+    cur_line = first
+    line_toks: List[Tok] = []
+    for m in _NUMBER_RE.finditer(window_text):
+        abs_start = lo + m.start()
+        if abs_start >= starts[cur_line + 1] - 1:
+            # Crossed into a later line: resolve the finished line first.
+            val = _best_line_token(line_toks)
+            if val is not None:
+                return val
+            line_toks = []
+            while abs_start >= starts[cur_line + 1] - 1:
+                cur_line += 1
+        line_toks.append(_tok(m.group(0)))
 
-        # Case 1: prefer tokens that include a dollar sign on this line
-        dollar_tokens = [t for t in raw_tokens if '$' in t]
-        if dollar_tokens:
-            return _pick_leftmost(dollar_tokens)
+    return _best_line_token(line_toks)
 
-        # Case 2: otherwise require >=4 digits after normalization and not a bare year
-        long_tokens: List[str] = []
-        for t in raw_tokens:
-            norm = t.strip().replace('$', '').replace(',', '').replace(' ', '').replace('.', '').replace('(', '').replace(')', '')
-            if norm.isdigit() and len(norm) >= 4 and not _looks_like_year(t):
-                long_tokens.append(t)
 
-        if long_tokens:
-            return _pick_leftmost(long_tokens)
 
-    return None
+# Lines re-scanned across a page boundary so `_best_number_in_next_lines`
+# look-ahead still works when a label sits near the end of a page. Must be
+# larger than the biggest look-ahead window (12).
+_CARRY_LINES = 15
 
+# Once one value is found, stop scanning if the other hasn't appeared within
+# this many lines: on real income statements COS sits within ~30 lines of
+# Revenue, so a huge gap means the missing value isn't coming and the view
+# will 422 anyway. Env-tunable for unusual layouts.
+_MAX_LABEL_GAP = int(os.environ.get("MAX_LABEL_GAP", "200"))
 
 
-def extract_values_from_pdf(pdf_bytes: bytes) -> Dict[str, Optional[str]]:
+# Parallel extraction kicks in above this page count; below it the pool
+# startup cost outweighs the win.
+_PARALLEL_MIN_PAGES = 50
+_PARALLEL_CHUNK = 8
+
+
+def _open_doc(src):
+    if isinstance(src, (str, Path)):
+        return fitz.open(src)  # memory-maps the file
+    return fitz.open(stream=src, filetype="pdf")
+
+
+def _extract_page_range(src, start: int, stop: int) -> List[str]:
+    """Worker: extract text for pages [start, stop). Runs in a child process."""
+    doc = _open_doc(src)
+    try:
+        return [doc.load_page(i).get_text("text") for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _parallel_page_texts(src, page_count: int):
+    """
+    Yield page texts in order, extracting ranges of pages across a small
+    process pool. Results are consumed in submission order so the caller's
+    carry-buffer/early-exit logic is unaffected; breaking out early cancels
+    the not-yet-started ranges.
+    """
+    workers = min(4, os.cpu_count() or 1)
+    if isinstance(src, (str, Path)):
+        chunk = _PARALLEL_CHUNK  # path pickles cheaply; fine-grained ranges
+    else:
+        chunk = -(-page_count // workers)  # bytes pickle per submit; one slice each
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            ex.submit(_extract_page_range, src, s, min(s + chunk, page_count))
+            for s in range(0, page_count, chunk)
+        ]
+        try:
+            for fut in futures:
+                yield from fut.result()
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+
+def _page_texts(pdf_source: PdfSource):
+    """Yield extracted text one page at a time so callers can stop early."""
+    if fitz is not None:
+        src = pdf_source
+        if not isinstance(src, (str, Path, bytes, bytearray)):
+            src = src.read()
+        doc = _open_doc(src)
+        page_count = doc.page_count
+        if page_count >= _PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+            doc.close()
+            yield from _parallel_page_texts(src, page_count)
+            return
+        try:
+            for page in doc:
+                yield page.get_text("text")
+        finally:
+            doc.close()
+    else:
+        # pdfminer fallback: no cheap per-page text API, so yield the whole
+        # document as a single "page" (correct, just no early-exit win).
+        # Layout analysis stays on: without it pdfminer emits text in raw
+        # stream order, which breaks the line grouping the scan relies on,
+        # and it is only ~10% of the fallback's runtime anyway.
+        if isinstance(pdf_source, (str, Path)):
+            with open(pdf_source, 'rb') as fh:
+                yield extract_text(fh) or ""
+        elif isinstance(pdf_source, (bytes, bytearray)):
+            yield extract_text(io.BytesIO(pdf_source)) or ""
+        else:
+            yield extract_text(pdf_source) or ""
+
+
+def extract_values_from_pdf(pdf_source: PdfSource) -> Dict[str, Optional[str]]:
     """
     Extract normalized 'revenue' and 'cos' from a text-based 10-K PDF.
+    `pdf_source` may be raw bytes, a filesystem path, or an open binary file.
     Heuristic:
       - choose the BEST number after the label on the same line;
       - if none, scan ahead up to 10 lines and pick the first money-like token.
+    Pages are processed one at a time and the scan stops as soon as both
+    values are found (the income statement is usually one page of a >100-page
+    filing).
     """
-    text = extract_text(io.BytesIO(pdf_bytes), laparams=LAParams()) or ""
-    lines = [ln.strip() for ln in text.splitlines()]
-
     revenue: Optional[str] = None
     cos: Optional[str] = None
 
-    i = 0
-    while i < len(lines) and (revenue is None or cos is None):
-        line = lines[i]
-
-        if revenue is None:
-            m = _REVENUE_LABEL_RE.search(line)
-            if m:
-                val = _best_number_after_label(line, m)
-                if not val:
-                    val = _best_number_in_next_lines(lines, i, window=10)
-                if val:
-                    revenue = _normalize_value(val)
+    carry_text = ""
+    carry_lines = 0
+    carry_has_label = False
+    found_line: Optional[int] = None  # absolute line of the first value found
+    total_lines = 0
+    for page_text in _page_texts(pdf_source):
+        # Cheap probe (C-level substring search) before the per-line regex
+        # scan: most pages of a 10-K mention neither label and can be
+        # skipped outright. Carry from a skipped page is label-free, so the
+        # look-ahead buffer can be dropped too.
+        low = page_text.lower()
+        page_has_label = ("revenue" in low) or ("cost of" in low)
+        if not page_has_label and not carry_has_label:
+            total_lines += page_text.count('\n') + 1
+            carry_text = ""
+            carry_lines = 0
+            if found_line is not None and total_lines - found_line > _MAX_LABEL_GAP:
+                break
+            continue
 
-        if cos is None:
-            m = _COS_LABEL_RE.search(line)
-            if m:
-                val = _best_number_after_label(line, m)
-                if not val:
-                    val = _best_number_in_next_lines(lines, i, window=12)
-                if val:
+        scan_text = carry_text + "\n" + page_text if carry_text else page_text
+        # Offsets of each line start in scan_text, so a match position maps
+        # to its line index with one bisect; lines are sliced out lazily only
+        # where a label or look-ahead actually touches them.
+        starts = _line_starts(scan_text)
+
+        for m in _label_matches(scan_text):
+            kind = m.lastgroup
+            if kind == 'rev' and revenue is not None:
+                continue
+            if kind == 'cos' and cos is not None:
+                continue
+
+            i = bisect.bisect_right(starts, m.start()) - 1
+            line = scan_text[starts[i]:starts[i + 1] - 1]
+            val = _best_number_after_label(line, m.end() - starts[i])
+            if not val:
+                window = 10 if kind == 'rev' else 12
+                val = _best_number_in_next_lines(scan_text, starts, i, window=window)
+            if val:
+                if kind == 'rev':
+                    revenue = _normalize_value(val)
+                else:
                     cos = _normalize_value(val)
-
-        i += 1
+                if found_line is None:
+                    # Line i includes carry from the previous page, which
+                    # total_lines has already counted.
+                    found_line = total_lines - carry_lines + i
+            if revenue is not None and cos is not None:
+                break
+
+        if revenue is not None and cos is not None:
+            break
+        total_lines += len(starts) - 1 - carry_lines
+        if found_line is not None and total_lines - found_line > _MAX_LABEL_GAP:
+            break
+        # Carry the tail of the page as a single slice (no per-line copies).
+        carry_from = max(0, len(starts) - 1 - _CARRY_LINES)
+        carry_text = scan_text[starts[carry_from]:]
+        carry_lines = len(starts) - 1 - carry_from
+        carry_low = carry_text.lower()
+        carry_has_label = ("revenue" in carry_low) or ("cost of" in carry_low)
 
     return {"revenue": revenue, "cos": cos}
 
 
+def _to_cents(s: str) -> Optional[int]:
+    """
+    Parse a normalized numeric string into integer cents.
+    Returns None when the string can't be represented exactly as cents
+    (more than 2 fractional digits, or not a plain decimal) so the caller
+    can fall back to Decimal.
+    """
+    neg = s.startswith('-')
+    if neg:
+        s = s[1:]
+    int_part, _, frac = s.partition('.')
+    if not int_part and not frac:
+        return None  # "", "-", ".": let the Decimal path reject them
+    if frac and not frac.isdigit():
+        return None  # e.g. "1.-5": int("-5" + "00") would silently parse
+    if len(frac) > 2:
+        return None
+    try:
+        n = int(int_part or '0') * 100 + int((frac + '00')[:2])
+    except ValueError:
+        return None
+    return -n if neg else n
+
+
+def _format_cents(n: int) -> str:
+    """Render integer cents as a plain numeric string, trailing zeros stripped."""
+    sign = '-' if n < 0 else ''
+    whole, cents = divmod(abs(n), 100)
+    if cents == 0:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{cents:02d}".rstrip('0')
+
+
 def compute_gross_profit(revenue_str: str, cos_str: str) -> str:
     """
     Compute gross_profit = revenue - cos.
     Inputs are normalized numeric strings (may include a leading '-'
     and/or a decimal point). Returns a numeric string with no commas
     or trailing zeros. Raises ValueError for missing/invalid inputs.
+    10-K amounts are virtually always integers or 2dp, so the common path
+    is exact integer-cents arithmetic; Decimal (slow: context setup plus
+    arbitrary-precision dispatch) only handles >2dp stragglers.
     """
     if revenue_str is None or cos_str is None:
         raise ValueError("Missing revenue or cost of sales value.")
 
+    rev_c = _to_cents(revenue_str)
+    cos_c = _to_cents(cos_str)
+    if rev_c is not None and cos_c is not None:
+        return _format_cents(rev_c - cos_c)
+
     try:
         rev = Decimal(revenue_str)
         cos = Decimal(cos_str)
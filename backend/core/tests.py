@@ -14,6 +14,9 @@ class GrossProfitTests(SimpleTestCase):
     def test_minus_zero(self):
         self.assertEqual(compute_gross_profit("0", "0"), "0")
 
+    def test_three_decimal_places_falls_back_to_decimal(self):
+        self.assertEqual(compute_gross_profit("1.005", "0.001"), "1.004")
+
     def test_missing_value(self):
         with self.assertRaises(ValueError):
             compute_gross_profit(None, "10")
@@ -21,3 +24,11 @@ class GrossProfitTests(SimpleTestCase):
     def test_invalid_value(self):
         with self.assertRaises(ValueError):
             compute_gross_profit("10x", "5")
+
+    def test_empty_value(self):
+        with self.assertRaises(ValueError):
+            compute_gross_profit("", "0")
+
+    def test_signed_fraction(self):
+        with self.assertRaises(ValueError):
+            compute_gross_profit("1.-5", "0")
@@ -1,9 +1,27 @@
+import asyncio
+import hashlib
+
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 
 from .parsing import extract_values_from_pdf, compute_gross_profit
 
+# Parsed results are cached by content hash for repeat uploads of the same
+# file (common during development and UI retries). Hashing is ~free next to
+# parsing; Django's default LocMemCache backs this when no cache is configured.
+_EXTRACT_CACHE_TIMEOUT = 3600
+
+
+def _content_key(file) -> str:
+    """BLAKE2b digest of the upload, streamed chunk-wise (no full buffer)."""
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in file.chunks():
+        h.update(chunk)
+    file.seek(0)
+    return "extract:" + h.hexdigest()
+
 def health(request):
     return JsonResponse({"status": "ok"})
 
@@ -12,9 +30,12 @@ def _json_error(message: str, status: int):
 
 @csrf_exempt                 # Simplifies dev; safe since this is a local OA.
 @require_POST
-def extract_view(request):
+async def extract_view(request):
     """
     POST /api/extract/
+    Async view: hashing and PDF parsing run on the threadpool via
+    asyncio.to_thread, so one slow filing doesn't serialize other requests
+    (or the health endpoint) when served under ASGI.
     Form-data:
       - file: PDF (required)
       - period_end_date: YYYY-MM-DD (optional)
@@ -41,16 +62,30 @@ def extract_view(request):
     # Optional date; echo back as provided (or null)
     period_end_date = request.POST.get("period_end_date") or None
 
-    try:
-        pdf_bytes = file.read()
-    except Exception:
-        return _json_error("Failed to read uploaded file.", 400)
+    # Large uploads are spooled to disk (TemporaryUploadedFile); hand the
+    # parser the path so the PDF is memory-mapped instead of buffered into
+    # RAM twice. Small in-memory uploads are passed as the file object itself
+    # (no intermediate BytesIO copy).
+    if hasattr(file, "temporary_file_path"):
+        pdf_source = file.temporary_file_path()
+    else:
+        pdf_source = file
 
-    # Parse values
     try:
-        vals = extract_values_from_pdf(pdf_bytes)  # {"revenue": str|None, "cos": str|None}
+        cache_key = await asyncio.to_thread(_content_key, file)
     except Exception:
-        return _json_error("Failed to extract text from PDF.", 500)
+        cache_key = None  # unhashable upload: just parse without caching
+
+    # Parse values (or reuse a cached result for an identical upload)
+    vals = await cache.aget(cache_key) if cache_key else None
+    if vals is None:
+        try:
+            # {"revenue": str|None, "cos": str|None}
+            vals = await asyncio.to_thread(extract_values_from_pdf, pdf_source)
+        except Exception:
+            return _json_error("Failed to extract text from PDF.", 500)
+        if cache_key:
+            await cache.aset(cache_key, vals, timeout=_EXTRACT_CACHE_TIMEOUT)
 
     revenue = vals.get("revenue")
     cos = vals.get("cos")